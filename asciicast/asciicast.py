@@ -5,23 +5,102 @@ Great for tutorials, demos, etc.
 """
 
 import argparse
+import codecs
 import json
+import mmap
 import os
 import pty
 import select
+import selectors
 import subprocess
 import sys
 import termios
 import time
 import tty
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+
+# Events are stored one compact JSON value per line; orjson is used when installed
+try:
+    import orjson
+    
+    def _dump_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    
+    _loads = orjson.loads
+except ImportError:
+    _encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    
+    def _dump_line(obj) -> bytes:
+        return (_encode(obj) + "\n").encode('utf-8')
+    
+    _loads = json.loads
+
+# Optional streaming parser for recordings saved as one JSON document
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Consecutive same-type chunks closer than this are merged into one event
+COALESCE_WINDOW = 0.016  # seconds
+COALESCE_MAX_BYTES = 65536
+
+def _write_all(fd: int, chunks: List[bytes]):
+    """Write every chunk to fd with writev, finishing any partial writes"""
+    while chunks:
+        try:
+            written = os.writev(fd, chunks)
+        except BlockingIOError:
+            select.select([], [fd], [])
+            continue
+        
+        # Drop the chunks that went out in full and trim the one cut short
+        while chunks and written >= len(chunks[0]):
+            written -= len(chunks.pop(0))
+        if written:
+            chunks[0] = chunks[0][written:]
 
 class AsciicastRecorder:
     def __init__(self, output_file: str):
         self.output_file = output_file
-        self.events: List[Dict[str, Any]] = []
+        self.fh = None
         self.start_time = None
         
+        # Event being accumulated before it is written
+        self._pending = bytearray()
+        self._pending_type = None
+        self._pending_t = None
+        # Incremental decoders keep multi-byte characters split across reads intact
+        self._decoders = {
+            "i": codecs.getincrementaldecoder('utf-8')(errors='replace'),
+            "o": codecs.getincrementaldecoder('utf-8')(errors='replace'),
+        }
+    
+    def _emit(self, t: float, event_type: str, data: bytes):
+        """Queue an event, merging it into the pending one when close enough"""
+        if (event_type == self._pending_type
+                and t - self._pending_t < COALESCE_WINDOW
+                and len(self._pending) + len(data) < COALESCE_MAX_BYTES):
+            self._pending += data
+            return
+        
+        self._flush_pending()
+        self._pending_type = event_type
+        self._pending_t = t
+        self._pending += data
+    
+    def _flush_pending(self):
+        """Write the pending event, if any"""
+        if self._pending_type is None:
+            return
+        
+        text = self._decoders[self._pending_type].decode(bytes(self._pending))
+        if text:
+            self.fh.write(_dump_line([self._pending_t, self._pending_type, text]))
+        self._pending.clear()
+        self._pending_type = None
+        
     def record(self, shell: str = None):
         """Record a terminal session"""
         if shell is None:
@@ -33,6 +112,8 @@ class AsciicastRecorder:
         # Save original terminal settings
         old_tty = termios.tcgetattr(sys.stdin)
         
+        sel = None
+        pidfd = None
         try:
             # Create pseudo-terminal
             master, slave = pty.openpty()
@@ -53,70 +134,126 @@ class AsciicastRecorder:
             # Set terminal to raw mode
             tty.setraw(sys.stdin.fileno())
             
-            self.start_time = time.time()
+            # Only truncate the output once the session has actually started
+            self.fh = open(self.output_file, 'wb', buffering=1 << 16)
+            
+            # Event times are offsets on the monotonic clock, so wall-clock
+            # jumps (NTP, suspend) can't reorder them
+            self.start_time = time.monotonic()
+            size = os.get_terminal_size()
             
             # Record header
             header = {
                 "version": 2,
-                "width": os.get_terminal_size().columns,
-                "height": os.get_terminal_size().lines,
-                "timestamp": int(self.start_time),
+                "width": size.columns,
+                "height": size.lines,
+                "timestamp": int(time.time()),
                 "env": {
                     "SHELL": shell,
                     "TERM": os.environ.get('TERM', 'xterm-256color')
                 }
             }
+            self.fh.write(_dump_line(header))
+            
+            # Register both sides of the pty once and block until one is ready
+            sel = selectors.DefaultSelector()
+            sel.register(sys.stdin, selectors.EVENT_READ, 'in')
+            sel.register(master, selectors.EVENT_READ, 'out')
+            
+            # Where pidfds exist (Linux 5.3+), the shell's exit wakes us up too;
+            # otherwise fall back to polling the process between short waits
+            timeout = 0.1
+            if hasattr(os, 'pidfd_open'):
+                try:
+                    pidfd = os.pidfd_open(proc.pid)
+                    sel.register(pidfd, selectors.EVENT_READ, 'exit')
+                    timeout = None
+                except OSError:
+                    if pidfd is not None:
+                        os.close(pidfd)
+                    pidfd = None
+            
+            # Bind fds and the writer to locals for the hot loop
+            stdin_fd = sys.stdin.fileno()
+            stdout_fd = sys.stdout.fileno()
+            master_fd = master
+            start_time = self.start_time
+            emit = self._emit
+            
+            # Non-blocking master so each wakeup can drain everything buffered
+            os.set_blocking(master_fd, False)
             
             # Main recording loop
-            while proc.poll() is None:
-                ready, _, _ = select.select([sys.stdin, master], [], [], 0.1)
+            running = True
+            while running:
+                ready = sel.select(timeout)
+                if pidfd is None and proc.poll() is not None:
+                    break
+                
+                now = time.monotonic() - start_time
                 
-                if sys.stdin in ready:
-                    # Read input from user
-                    try:
-                        data = os.read(sys.stdin.fileno(), 1024)
+                for key, _ in ready:
+                    if key.data == 'exit':
+                        running = False
+                    
+                    elif key.data == 'in':
+                        # Read input from user
+                        try:
+                            data = os.read(stdin_fd, 65536)
+                        except OSError:
+                            running = False
+                            break
                         if data:
                             # Send to shell
-                            os.write(master, data)
+                            _write_all(master_fd, [data])
                             # Record input event
-                            self.events.append([
-                                time.time() - self.start_time,
-                                "i",
-                                data.decode('utf-8', errors='replace')
-                            ])
-                    except OSError:
-                        break
-                
-                if master in ready:
-                    # Read output from shell
-                    try:
-                        data = os.read(master, 1024)
-                        if data:
-                            # Write to terminal
-                            os.write(sys.stdout.fileno(), data)
-                            # Record output event
-                            self.events.append([
-                                time.time() - self.start_time,
-                                "o",
-                                data.decode('utf-8', errors='replace')
-                            ])
-                    except OSError:
-                        break
+                            emit(now, "i", data)
+                        else:
+                            # stdin hit EOF; stop watching it
+                            sel.unregister(sys.stdin)
+                    
+                    elif key.data == 'out':
+                        # Read everything the shell has written so far, up to 64 KiB
+                        chunks = []
+                        size = 0
+                        closed = False
+                        while size < COALESCE_MAX_BYTES:
+                            try:
+                                data = os.read(master_fd, 65536)
+                            except BlockingIOError:
+                                break
+                            except OSError:
+                                closed = True
+                                break
+                            if not data:
+                                break
+                            chunks.append(data)
+                            size += len(data)
+                        
+                        if chunks:
+                            # Record output event; chunks merge into one pending event
+                            for data in chunks:
+                                emit(now, "o", data)
+                            # Write to terminal in a single writev
+                            _write_all(stdout_fd, chunks)
+                        
+                        if closed:
+                            running = False
+                            break
             
-            # Save recording
-            recording = {
-                **header,
-                "events": self.events
-            }
-            
-            with open(self.output_file, 'w') as f:
-                json.dump(recording, f, indent=2)
-                
             print(f"\nRecording saved to {self.output_file}")
             
         finally:
             # Restore terminal settings
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_tty)
+            if sel is not None:
+                sel.close()
+            if pidfd is not None:
+                os.close(pidfd)
+            if self.fh is not None:
+                self._flush_pending()
+                self.fh.close()
+                self.fh = None
             try:
                 os.close(master)
             except:
@@ -125,48 +262,163 @@ class AsciicastRecorder:
 class AsciicastPlayer:
     def __init__(self, input_file: str):
         self.input_file = input_file
-        self.recording = None
+        self.header = None
+        self.events = None
         
     def load_recording(self):
-        """Load recording from file"""
+        """Load recording header; events are read lazily from the file"""
         try:
-            with open(self.input_file, 'r') as f:
-                self.recording = json.load(f)
+            f = open(self.input_file, 'rb')
         except FileNotFoundError:
             print(f"Error: Recording file '{self.input_file}' not found")
             sys.exit(1)
+        
+        try:
+            header = _loads(f.readline())
         except json.JSONDecodeError:
+            header = None
+        
+        # Older recordings were saved as a single JSON document; a compact one
+        # fits on the first line and parses like a header that holds the events
+        if not isinstance(header, dict) or 'events' in header:
+            f.seek(0)
+            self._load_legacy(f)
+            return
+        
+        self.header = header
+        self.events = self._iter_events(f)
+    
+    def _iter_events(self, f) -> Iterator[List[Any]]:
+        """Yield events one line at a time, scanning a memory map for newlines"""
+        with f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not mappable (e.g. a pipe); fall back to buffered line reads
+                for line in f:
+                    if line.strip():
+                        try:
+                            event = _loads(line)
+                        except ValueError:
+                            if f.read().strip():
+                                raise
+                            self._warn_truncated()
+                            return
+                        yield event
+                return
+            
+            with mm:
+                pos = f.tell()
+                end = len(mm)
+                while pos < end:
+                    newline = mm.find(b'\n', pos)
+                    if newline == -1:
+                        newline = end
+                    line = mm[pos:newline]
+                    if line.strip():
+                        try:
+                            event = _loads(line)
+                        except ValueError:
+                            if mm[newline + 1:end].strip():
+                                raise
+                            self._warn_truncated()
+                            return
+                        yield event
+                    pos = newline + 1
+    
+    def _warn_truncated(self):
+        """Report a recording whose last event was cut off mid-write"""
+        # The recorder writes through a buffer, so a crash usually leaves half a line
+        print(f"\nWarning: '{self.input_file}' ends with a truncated event; stopping there")
+    
+    def _load_legacy(self, f):
+        """Load a single-document recording, streaming its events if ijson is available"""
+        if not HAS_IJSON:
+            try:
+                recording = json.load(f)
+            except json.JSONDecodeError:
+                print(f"Error: Invalid recording file '{self.input_file}'")
+                sys.exit(1)
+            finally:
+                f.close()
+            self.events = iter(recording.pop('events', []))
+            self.header = recording
+            return
+        
+        try:
+            self.header = self._read_legacy_header(f)
+        except ijson.JSONError:
+            f.close()
             print(f"Error: Invalid recording file '{self.input_file}'")
             sys.exit(1)
+        
+        f.seek(0)
+        self.events = self._iter_legacy_events(f)
+    
+    def _read_legacy_header(self, f) -> Dict[str, Any]:
+        """Build the top-level keys that precede the events array"""
+        header = {}
+        key = None
+        builder = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is None:
+                if prefix == '' and event == 'map_key':
+                    if value == 'events':
+                        break
+                    key = value
+                    builder = ijson.ObjectBuilder()
+                continue
+            
+            builder.event(event, value)
+            # The value is complete once its own prefix closes or yields a scalar
+            if prefix == key and event not in ('start_map', 'start_array', 'map_key'):
+                header[key] = builder.value
+                builder = None
+        return header
+    
+    def _iter_legacy_events(self, f) -> Iterator[List[Any]]:
+        """Yield events from a legacy recording's events array"""
+        with f:
+            try:
+                yield from ijson.items(f, 'events.item', use_float=True)
+            except ijson.JSONError:
+                print(f"\nError: Invalid recording file '{self.input_file}'")
     
     def play(self, speed: float = 1.0):
         """Play back the recording"""
-        if not self.recording:
+        if self.events is None:
             self.load_recording()
         
         print(f"Playing {self.input_file}")
         print("Press Ctrl+C to stop playback")
         
         # Clear screen
-        print("\033[2J\033[H", end='')
+        print("\033[2J\033[H", end='', flush=True)
+        
+        # Output goes straight to the byte stream, flushed only before pauses
+        out = sys.stdout.buffer
         
         try:
-            last_time = 0
-            for event in self.recording.get('events', []):
+            # Wait for each event's absolute deadline so sleep overshoot doesn't add up
+            start = time.monotonic()
+            for event in self.events:
                 timestamp, event_type, data = event
                 
-                # Calculate delay
-                delay = (timestamp - last_time) / speed
-                if delay > 0:
-                    time.sleep(delay)
-                
                 # Only play output events
-                if event_type == "o":
-                    print(data, end='', flush=True)
+                if event_type != "o":
+                    continue
+                
+                delay = start + timestamp / speed - time.monotonic()
+                if delay > 0.001:
+                    out.flush()
+                    time.sleep(delay)
                 
-                last_time = timestamp
+                out.write(data.encode('utf-8', errors='replace'))
+            
+            out.flush()
                 
         except KeyboardInterrupt:
+            out.flush()
             print("\nPlayback stopped")
         
         print("\nPlayback finished")
@@ -209,15 +461,23 @@ def main():
     
     elif args.command == 'info':
         try:
-            with open(args.input, 'r') as f:
-                recording = json.load(f)
+            player = AsciicastPlayer(args.input)
+            player.load_recording()
+            header = player.header
+            
+            # Walk the events once, keeping only the count and last timestamp
+            count = 0
+            duration = 0.0
+            for event in player.events:
+                count += 1
+                duration = event[0]
             
             print(f"File: {args.input}")
-            print(f"Version: {recording.get('version', 'unknown')}")
-            print(f"Size: {recording.get('width', '?')}x{recording.get('height', '?')}")
-            print(f"Duration: {recording['events'][-1][0]:.2f}s" if recording.get('events') else "0s")
-            print(f"Events: {len(recording.get('events', []))}")
-            print(f"Shell: {recording.get('env', {}).get('SHELL', 'unknown')}")
+            print(f"Version: {header.get('version', 'unknown')}")
+            print(f"Size: {header.get('width', '?')}x{header.get('height', '?')}")
+            print(f"Duration: {duration:.2f}s" if count else "0s")
+            print(f"Events: {count}")
+            print(f"Shell: {header.get('env', {}).get('SHELL', 'unknown')}")
             
         except Exception as e:
             print(f"Error reading file: {e}")
@@ -12,12 +12,16 @@ import sqlite3
 import sys
 import time
 import subprocess
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 import hashlib
 import difflib
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # Cross-platform clipboard handling
 try:
@@ -33,130 +37,311 @@ try:
 except ImportError:
     HAS_CURSES = False
 
+# Optional C implementation of difflib's matcher; unified_diff picks it up
+# through the module-level SequenceMatcher name
+try:
+    from cdifflib import CSequenceMatcher
+    difflib.SequenceMatcher = CSequenceMatcher
+except ImportError:
+    pass
+
+# Optional single-pass matcher for sensitive keywords
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional faster JSON encoder/decoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Batching of clipboard writes in watch mode
+FLUSH_BATCH_SIZE = 20  # entries
+FLUSH_INTERVAL = 2.0   # seconds
+
+# Minimum time between auto-expire sweeps in watch mode
+EXPIRE_INTERVAL = 60.0  # seconds
+
+# Diffs of content larger than this are handed to git
+LARGE_DIFF_SIZE = 256 * 1024  # characters
+
+# Content longer than this is hashed in pieces rather than encoded at once
+HASH_CHUNK_SIZE = 1 << 20  # characters
+
+def content_hash(content: str) -> bytes:
+    """Hash clipboard content, encoding large payloads piecewise"""
+    if len(content) <= HASH_CHUNK_SIZE:
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    
+    hasher = hashlib.blake2b(digest_size=16)
+    for i in range(0, len(content), HASH_CHUNK_SIZE):
+        hasher.update(content[i:i + HASH_CHUNK_SIZE].encode('utf-8'))
+    return hasher.digest()
+
+def dump_json(obj, pretty: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+def load_json(data: bytes):
+    """Decode JSON, with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class ClipboardEntry:
     def __init__(self, content: str, timestamp: datetime, source_app: str = "unknown"):
         self.content = content
         self.timestamp = timestamp
         self.source_app = source_app
-        self.hash = hashlib.md5(content.encode()).hexdigest()
+        self._hash = None
+    
+    @property
+    def hash(self) -> bytes:
+        """128-bit BLAKE2b digest of the content, computed on first use"""
+        if self._hash is None:
+            self._hash = content_hash(self.content)
+        return self._hash
         
     def to_dict(self) -> Dict:
         return {
             "content": self.content,
             "timestamp": self.timestamp.isoformat(),
             "source_app": self.source_app,
-            "hash": self.hash
+            "hash": self.hash.hex()
         }
 
 class ClipulseDB:
+    # Bumped by one-time migrations; stored in PRAGMA user_version
+    SCHEMA_VERSION = 1
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL + NORMAL only fsyncs on checkpoints instead of on every commit
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self.init_db()
     
     def init_db(self):
         """Initialize the SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS clipboard_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                content TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                source_app TEXT,
-                hash TEXT UNIQUE
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS clipboard_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    content TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    source_app TEXT,
+                    hash BLOB UNIQUE
+                )
+            ''')
+            self.conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_ts ON clipboard_history(timestamp)
+            ''')
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] < 1:
+            self.migrate_hashes()
+        self.has_fts = self.init_fts()
+    
+    def migrate_hashes(self, batch_size: int = 500):
+        """Rehash rows stored with the old MD5 hex digests so duplicates still match"""
+        last_id = 0
+        with self.conn:
+            while True:
+                rows = self.conn.execute('''
+                    SELECT id, content FROM clipboard_history
+                    WHERE typeof(hash) = 'text' AND id > ?
+                    ORDER BY id LIMIT ?
+                ''', (last_id, batch_size)).fetchall()
+                if not rows:
+                    break
+                self.conn.executemany(
+                    'UPDATE OR IGNORE clipboard_history SET hash = ? WHERE id = ?',
+                    [(content_hash(content), row_id) for row_id, content in rows]
+                )
+                last_id = rows[-1][0]
+            
+            # Rows left as text duplicate content that was stored again under
+            # the new hash before this migration existed
+            self.conn.execute("DELETE FROM clipboard_history WHERE typeof(hash) = 'text'")
+            # Committed with the rehash, so an interrupted run is simply redone
+            self.conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+    
+    def init_fts(self) -> bool:
+        """Set up the full-text search index, return False if SQLite lacks FTS5"""
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'clipboard_fts'"
+        ).fetchone() is not None
+        
+        try:
+            with self.conn:
+                # Trigram tokens keep substring semantics of the old LIKE search
+                self.conn.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS clipboard_fts USING fts5(
+                        content, content='clipboard_history', content_rowid='id',
+                        tokenize='trigram'
+                    )
+                ''')
+                self.conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS clipboard_fts_insert
+                    AFTER INSERT ON clipboard_history BEGIN
+                        INSERT INTO clipboard_fts(rowid, content) VALUES (new.id, new.content);
+                    END
+                ''')
+                self.conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS clipboard_fts_delete
+                    AFTER DELETE ON clipboard_history BEGIN
+                        INSERT INTO clipboard_fts(clipboard_fts, rowid, content)
+                        VALUES ('delete', old.id, old.content);
+                    END
+                ''')
+                if not existed:
+                    # Index rows stored before the search index existed
+                    self.conn.execute("INSERT INTO clipboard_fts(clipboard_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError:
+            return False
+        return True
     
     def add_entry(self, entry: ClipboardEntry) -> bool:
         """Add entry to database, return True if added, False if duplicate"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                INSERT INTO clipboard_history (content, timestamp, source_app, hash)
+        return bool(self.add_entries([entry]))
+    
+    def add_entries(self, entries: List[ClipboardEntry]) -> List[ClipboardEntry]:
+        """Add entries in a single transaction, return the ones that were not duplicates"""
+        # Drop duplicates within the batch, then those already stored
+        unique = {}
+        for entry in entries:
+            unique.setdefault(entry.hash, entry)
+        if not unique:
+            return []
+        
+        placeholders = ",".join("?" * len(unique))
+        existing = {row[0] for row in self.conn.execute(
+            f'SELECT hash FROM clipboard_history WHERE hash IN ({placeholders})',
+            list(unique)
+        )}
+        new_entries = [e for h, e in unique.items() if h not in existing]
+        
+        with self.conn:
+            self.conn.executemany('''
+                INSERT OR IGNORE INTO clipboard_history (content, timestamp, source_app, hash)
                 VALUES (?, ?, ?, ?)
-            ''', (entry.content, entry.timestamp.isoformat(), entry.source_app, entry.hash))
-            conn.commit()
-            return True
-        except sqlite3.IntegrityError:
-            # Duplicate hash
-            return False
-        finally:
-            conn.close()
+            ''', [(e.content, e.timestamp.isoformat(), e.source_app, e.hash)
+                  for e in new_entries])
+        return new_entries
     
-    def get_history(self, limit: int = 100) -> List[ClipboardEntry]:
-        """Get clipboard history"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
+    def get_history_rows(self, limit: int = 100) -> Iterator[Tuple[str, str, str]]:
+        """Yield raw (content, timestamp, source_app) rows, newest first"""
+        yield from self.conn.execute('''
             SELECT content, timestamp, source_app FROM clipboard_history
             ORDER BY timestamp DESC LIMIT ?
         ''', (limit,))
-        
-        entries = []
-        for row in cursor.fetchall():
-            entries.append(ClipboardEntry(
-                content=row[0],
-                timestamp=datetime.fromisoformat(row[1]),
-                source_app=row[2]
-            ))
-        
-        conn.close()
-        return entries
+    
+    def search_history_rows(self, keyword: str) -> Iterator[Tuple[str, str, str]]:
+        """Yield raw (content, timestamp, source_app) rows containing keyword"""
+        # Trigram index needs at least 3 characters; shorter keywords scan the table
+        if self.has_fts and len(keyword) >= 3:
+            yield from self.conn.execute('''
+                SELECT h.content, h.timestamp, h.source_app
+                FROM clipboard_fts f JOIN clipboard_history h ON h.id = f.rowid
+                WHERE clipboard_fts MATCH ? ORDER BY h.timestamp DESC
+            ''', ('"' + keyword.replace('"', '""') + '"',))
+        else:
+            yield from self.conn.execute('''
+                SELECT content, timestamp, source_app FROM clipboard_history
+                WHERE content LIKE ? ORDER BY timestamp DESC
+            ''', (f'%{keyword}%',))
+    
+    def iter_all_rows(self) -> Iterator[Tuple[str, str, str, bytes]]:
+        """Yield every (content, timestamp, source_app, hash) row, newest first, in batches"""
+        cursor = self.conn.execute('''
+            SELECT content, timestamp, source_app, hash FROM clipboard_history
+            ORDER BY timestamp DESC
+        ''')
+        cursor.arraysize = 1000
+        while rows := cursor.fetchmany():
+            yield from rows
+    
+    def get_history(self, limit: int = 100) -> List[ClipboardEntry]:
+        """Get clipboard history"""
+        return [ClipboardEntry(content, datetime.fromisoformat(timestamp), source_app)
+                for content, timestamp, source_app in self.get_history_rows(limit)]
     
     def search_history(self, keyword: str) -> List[ClipboardEntry]:
         """Search clipboard history"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT content, timestamp, source_app FROM clipboard_history
-            WHERE content LIKE ? ORDER BY timestamp DESC
-        ''', (f'%{keyword}%',))
-        
-        entries = []
-        for row in cursor.fetchall():
-            entries.append(ClipboardEntry(
-                content=row[0],
-                timestamp=datetime.fromisoformat(row[1]),
-                source_app=row[2]
-            ))
-        
-        conn.close()
-        return entries
+        return [ClipboardEntry(content, datetime.fromisoformat(timestamp), source_app)
+                for content, timestamp, source_app in self.search_history_rows(keyword)]
     
     def clear_history(self):
         """Clear all clipboard history"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM clipboard_history')
-        conn.commit()
-        conn.close()
+        with self.conn:
+            self.conn.execute('DELETE FROM clipboard_history')
     
     def expire_old_entries(self, minutes: int):
         """Remove entries older than specified minutes"""
         cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            DELETE FROM clipboard_history 
-            WHERE timestamp < ?
-        ''', (cutoff_time.isoformat(),))
-        conn.commit()
-        conn.close()
+        # ISO timestamps sort chronologically as text, so this is a range scan on idx_ts
+        with self.conn:
+            self.conn.execute('''
+                DELETE FROM clipboard_history 
+                WHERE timestamp < ?
+            ''', (cutoff_time.isoformat(),))
 
 class ClipulseConfig:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.config = self.load_config()
+        self._rebuild_caches()
+    
+    def _rebuild_caches(self):
+        """Precompile filters so each clipboard check is a single pass"""
+        filters = self.config["filters"]
+        
+        # Lowercased app names for substring matching
+        self._ignore_apps_lc = tuple(app.lower() for app in filters["ignore_apps"])
+        
+        # One regex per pattern, merged into a single union when that is safe
+        compiled = []
+        for pattern in filters["ignore_patterns"]:
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except re.error as e:
+                print(f"⚠️  Skipping invalid pattern {pattern!r}: {e}")
+        self._ignore_res = tuple(compiled)
+        
+        # Joining renumbers capture groups, which would silently break numbered
+        # backreferences, and some patterns (e.g. inline global flags) can't be
+        # combined at all; keep them separate in either case
+        if len(compiled) > 1 and all(regex.groups == 0 for regex in compiled):
+            try:
+                self._ignore_res = (re.compile("|".join(f"(?:{r.pattern})" for r in compiled),
+                                               re.IGNORECASE),)
+            except re.error:
+                pass
+        
+        # All sensitive keywords are matched in one scan of the content
+        keywords = [k for k in self.config["notifications"]["sensitive_keywords"] if k]
+        self._sensitive_ac = None
+        self._sensitive_re = None
+        if keywords and HAS_AHOCORASICK:
+            self._sensitive_ac = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._sensitive_ac.add_word(keyword.lower(), keyword)
+            self._sensitive_ac.make_automaton()
+        elif keywords:
+            self._sensitive_re = re.compile("|".join(re.escape(k) for k in keywords),
+                                            re.IGNORECASE)
     
     def load_config(self) -> Dict:
         """Load configuration from file"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    return load_json(f.read())
             except json.JSONDecodeError:
                 return self.default_config()
         return self.default_config()
@@ -184,15 +369,26 @@ class ClipulseConfig:
     
     def save_config(self):
         """Save configuration to file"""
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        with open(self.config_path, 'wb') as f:
+            f.write(dump_json(self.config, pretty=True))
+        self._rebuild_caches()
 
 class ClipulseMonitor:
-    def __init__(self, db: ClipulseDB, config: ClipulseConfig):
+    def __init__(self, db: ClipulseDB, config: ClipulseConfig, verbose: bool = True):
         self.db = db
         self.config = config
+        self.verbose = verbose
         self.running = False
         self.last_content = ""
+        self.pending: List[ClipboardEntry] = []
+        
+        # Webhook syncs share one keep-alive connection and run off the monitor loop
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._webhook_pool = ThreadPoolExecutor(max_workers=2)
         
     def get_active_app(self) -> str:
         """Get the currently active application (OS-specific)"""
@@ -224,80 +420,145 @@ class ClipulseMonitor:
         
         return "unknown"
     
+    def get_change_counter(self) -> Optional[Callable[[], int]]:
+        """Get a cheap clipboard change counter (OS-specific), if available"""
+        try:
+            if sys.platform == "darwin":  # macOS
+                try:
+                    from AppKit import NSPasteboard
+                    return NSPasteboard.generalPasteboard().changeCount
+                except ImportError:
+                    return None
+            elif sys.platform == "win32":  # Windows
+                import ctypes
+                return ctypes.windll.user32.GetClipboardSequenceNumber
+        except Exception:
+            return None
+        
+        return None
+    
     def should_ignore_content(self, content: str, app: str) -> bool:
         """Check if content should be ignored based on filters"""
-        filters = self.config.config["filters"]
-        
         # Check app filters
-        for ignored_app in filters["ignore_apps"]:
-            if ignored_app.lower() in app.lower():
-                return True
+        app_lc = app.lower()
+        if any(ignored_app in app_lc for ignored_app in self.config._ignore_apps_lc):
+            return True
         
         # Check pattern filters
-        for pattern in filters["ignore_patterns"]:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
+        return any(regex.search(content) for regex in self.config._ignore_res)
     
     def check_sensitive_content(self, content: str) -> bool:
         """Check if content contains sensitive keywords"""
         if not self.config.config["notifications"]["enabled"]:
             return False
         
-        keywords = self.config.config["notifications"]["sensitive_keywords"]
-        for keyword in keywords:
-            if keyword.lower() in content.lower():
+        if self.config._sensitive_ac is not None:
+            for _ in self.config._sensitive_ac.iter(content.lower()):
                 return True
+            return False
+        
+        if self.config._sensitive_re is not None:
+            return self.config._sensitive_re.search(content) is not None
+        
         return False
     
     def sync_to_webhook(self, entry: ClipboardEntry):
-        """Sync clipboard entry to webhook"""
+        """Sync clipboard entry to webhook in the background"""
         sync_config = self.config.config["sync"]
         if not sync_config["enabled"] or not sync_config["webhook_url"]:
             return
         
+        self._webhook_pool.submit(self._post_webhook, sync_config["webhook_url"], entry)
+    
+    def _post_webhook(self, url: str, entry: ClipboardEntry):
+        """POST an entry over the shared keep-alive session"""
         try:
-            response = requests.post(sync_config["webhook_url"], 
-                                   json=entry.to_dict(), 
-                                   timeout=5)
+            response = self._session.post(url,
+                                          data=dump_json(entry.to_dict()),
+                                          headers={'Content-Type': 'application/json'},
+                                          timeout=5)
             if response.status_code != 200:
                 print(f"Webhook sync failed: {response.status_code}")
         except Exception as e:
             print(f"Webhook sync error: {e}")
     
+    def flush_pending(self):
+        """Write queued entries in one transaction and report the new ones"""
+        if not self.pending:
+            return
+        entries = self.pending[:]
+        self.pending.clear()
+        
+        for entry in self.db.add_entries(entries):
+            if self.verbose:
+                print(f"📋 [{entry.timestamp.strftime('%H:%M:%S')}] "
+                      f"From {entry.source_app}: {entry.content[:50]}...")
+            
+            # Check for sensitive content
+            if self.check_sensitive_content(entry.content):
+                print("⚠️  WARNING: Sensitive content detected!")
+            
+            # Sync to webhook
+            self.sync_to_webhook(entry)
+    
     def start_monitoring(self):
         """Start monitoring clipboard"""
         self.running = True
         print("🔍 Clipulse is monitoring your clipboard... (Press Ctrl+C to stop)")
         
+        flush_deadline = None
+        change_count = self.get_change_counter()
+        last_count = None
+        
+        # Bind config and methods used on every tick to locals
+        expire_cfg = self.config.config["auto_expire"]
+        expire_on = expire_cfg["enabled"]
+        expire_minutes = expire_cfg["minutes"]
+        db_expire = self.db.expire_old_entries
+        paste = pyperclip.paste
+        get_app = self.get_active_app
+        pending = self.pending
+        # Expiry sweeps run on the first tick, then at most once a minute
+        next_expire = time.monotonic()
+        
         try:
             while self.running:
                 try:
-                    current_content = pyperclip.paste()
+                    # Only read the clipboard when its change counter moved;
+                    # without one, fall back to reading it on every tick
+                    if change_count is None:
+                        current_content = paste()
+                    else:
+                        count = change_count()
+                        if count != last_count:
+                            current_content = paste()
+                            last_count = count
+                        else:
+                            current_content = None
                     
-                    if current_content != self.last_content and current_content.strip():
-                        app = self.get_active_app()
+                    # String equality bails out early on a length mismatch; use
+                    # isspace() to check for blank content without copying it
+                    if (current_content and current_content != self.last_content
+                            and not current_content.isspace()):
+                        app = get_app()
                         
                         if not self.should_ignore_content(current_content, app):
-                            entry = ClipboardEntry(current_content, datetime.now(), app)
-                            
-                            if self.db.add_entry(entry):
-                                print(f"📋 [{entry.timestamp.strftime('%H:%M:%S')}] "
-                                      f"From {app}: {current_content[:50]}...")
-                                
-                                # Check for sensitive content
-                                if self.check_sensitive_content(current_content):
-                                    print("⚠️  WARNING: Sensitive content detected!")
-                                
-                                # Sync to webhook
-                                self.sync_to_webhook(entry)
+                            pending.append(ClipboardEntry(current_content, datetime.now(), app))
+                            if flush_deadline is None:
+                                flush_deadline = time.monotonic() + FLUSH_INTERVAL
                         
                         self.last_content = current_content
                     
+                    # Write queued entries once the batch is full or old enough
+                    now = time.monotonic()
+                    if pending and (len(pending) >= FLUSH_BATCH_SIZE or now >= flush_deadline):
+                        flush_deadline = None
+                        self.flush_pending()
+                    
                     # Auto-expire old entries
-                    if self.config.config["auto_expire"]["enabled"]:
-                        self.db.expire_old_entries(self.config.config["auto_expire"]["minutes"])
+                    if expire_on and now >= next_expire:
+                        db_expire(expire_minutes)
+                        next_expire = now + EXPIRE_INTERVAL
                     
                     time.sleep(0.5)  # Check every 500ms
                     
@@ -308,6 +569,12 @@ class ClipulseMonitor:
         except KeyboardInterrupt:
             print("\n👋 Stopping clipboard monitoring...")
             self.running = False
+        
+        self.flush_pending()
+        
+        # Let in-flight webhook syncs finish before closing the connection
+        self._webhook_pool.shutdown(wait=True)
+        self._session.close()
 
 def setup_data_directory() -> Tuple[str, str]:
     """Setup data directory and return paths"""
@@ -320,23 +587,69 @@ def setup_data_directory() -> Tuple[str, str]:
     
     return db_path, config_path
 
+def format_row(content: str, timestamp: str, source_app: str, show_full: bool = False) -> str:
+    """Format a raw history row for display"""
+    # Stored timestamps are ISO format; trim to seconds without parsing
+    timestamp = timestamp[:19].replace("T", " ")
+    text = content if show_full else content[:100]
+    if len(content) > 100 and not show_full:
+        text += "..."
+    
+    return f"[{timestamp}] {source_app}: {text}"
+
 def format_entry(entry: ClipboardEntry, show_full: bool = False) -> str:
     """Format a clipboard entry for display"""
-    timestamp = entry.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-    content = entry.content if show_full else entry.content[:100]
-    if len(entry.content) > 100 and not show_full:
-        content += "..."
-    
-    return f"[{timestamp}] {entry.source_app}: {content}"
+    return format_row(entry.content, entry.timestamp.isoformat(), entry.source_app, show_full)
+
+def _git_diff_lines(old_content: str, new_content: str) -> List[str]:
+    """Unified diff via git's C implementation, labelled like difflib's"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for name, content in (("previous", old_content), ("current", new_content)):
+            path = os.path.join(tmp_dir, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            paths.append(path)
+        
+        # Ignore external diff drivers and textconv from the user's gitconfig,
+        # and diff content with NUL bytes as text rather than "Binary files differ"
+        result = subprocess.run(['git', 'diff', '--no-index', '--no-color', '--no-ext-diff',
+                                 '--no-textconv', '--text', '-U3', '--', *paths],
+                                capture_output=True, text=True, encoding='utf-8', errors='replace')
+    
+    # Exit code 1 just means the files differ
+    if result.returncode not in (0, 1):
+        raise RuntimeError(result.stderr.strip())
+    
+    # Replace git's headers (temp paths, index line) with our own labels
+    lines = result.stdout.splitlines()
+    for i, line in enumerate(lines):
+        if line.startswith('@@'):
+            return ['--- Previous', '+++ Current'] + lines[i:]
+    
+    # No hunks for differing inputs means git's output can't be trusted
+    if old_content != new_content:
+        raise RuntimeError("git diff produced no hunks for differing content")
+    return []
 
 def show_diff(old_content: str, new_content: str):
     """Show diff between two clipboard entries"""
-    diff = difflib.unified_diff(
-        old_content.splitlines(keepends=True),
-        new_content.splitlines(keepends=True),
-        fromfile='Previous',
-        tofile='Current'
-    )
+    diff = None
+    if max(len(old_content), len(new_content)) > LARGE_DIFF_SIZE:
+        try:
+            diff = _git_diff_lines(old_content, new_content)
+        except (OSError, RuntimeError):
+            diff = None  # No usable git; fall back to difflib
+    
+    if diff is None:
+        old_lines = old_content.splitlines(keepends=True)
+        new_lines = old_lines if new_content == old_content else new_content.splitlines(keepends=True)
+        diff = difflib.unified_diff(
+            old_lines,
+            new_lines,
+            fromfile='Previous',
+            tofile='Current'
+        )
     
     print("📊 Content Diff:")
     for line in diff:
@@ -427,6 +740,7 @@ def main():
     
     # Watch command
     watch_parser = subparsers.add_parser('watch', help='Start monitoring clipboard')
+    watch_parser.add_argument('--quiet', action='store_true', help="Don't print each new entry")
     
     # History command
     history_parser = subparsers.add_parser('history', help='View clipboard history')
@@ -482,50 +796,64 @@ def main():
     
     # Handle commands
     if args.command == 'watch':
-        monitor = ClipulseMonitor(db, config)
+        monitor = ClipulseMonitor(db, config, verbose=not args.quiet)
         monitor.start_monitoring()
     
     elif args.command == 'history':
         if args.tui:
             tui_mode(db)
         else:
-            entries = db.get_history(args.limit)
-            if not entries:
+            rows = list(db.get_history_rows(args.limit))
+            if not rows:
                 print("📋 No clipboard history found.")
                 return
             
-            print(f"📋 Last {len(entries)} clipboard entries:")
-            for entry in entries:
-                print(format_entry(entry, args.full))
+            print(f"📋 Last {len(rows)} clipboard entries:")
+            for row in rows:
+                print(format_row(*row, args.full))
     
     elif args.command == 'search':
-        entries = db.search_history(args.keyword)
-        if not entries:
+        rows = list(db.search_history_rows(args.keyword))
+        if not rows:
             print(f"🔍 No entries found for '{args.keyword}'")
             return
         
-        print(f"🔍 Found {len(entries)} entries for '{args.keyword}':")
-        for entry in entries:
-            print(format_entry(entry, args.full))
+        print(f"🔍 Found {len(rows)} entries for '{args.keyword}':")
+        for row in rows:
+            print(format_row(*row, args.full))
     
     elif args.command == 'clear':
         db.clear_history()
         print("🗑️  Clipboard history cleared.")
     
     elif args.command == 'export':
-        entries = db.get_history(10000)  # Export all
+        # Rows are streamed straight to the file, one entry at a time
+        count = 0
         
         if args.json:
-            data = [entry.to_dict() for entry in entries]
-            output = json.dumps(data, indent=2)
             filename = args.output or "clipboard_history.json"
+            with open(filename, 'wb') as f:
+                f.write(b"[")
+                for content, timestamp, source_app, entry_hash in db.iter_all_rows():
+                    f.write(b",\n  " if count else b"\n  ")
+                    f.write(dump_json({
+                        "content": content,
+                        "timestamp": timestamp,
+                        "source_app": source_app,
+                        "hash": entry_hash.hex() if isinstance(entry_hash, bytes) else entry_hash
+                    }))
+                    count += 1
+                f.write(b"\n]" if count else b"]")
         else:  # Default to txt
-            output = "\n".join(format_entry(entry, True) for entry in entries)
             filename = args.output or "clipboard_history.txt"
+            with open(filename, 'w') as f:
+                for content, timestamp, source_app, _ in db.iter_all_rows():
+                    if count:
+                        f.write("\n")
+                    f.write(format_row(content, timestamp, source_app, True))
+                    count += 1
         
-        with open(filename, 'w') as f:
-            f.write(output)
-        print(f"📄 Exported {len(entries)} entries to {filename}")
+        print(f"📄 Exported {count} entries to {filename}")
     
     elif args.command == 'filter':
         if args.add_app:
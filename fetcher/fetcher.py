@@ -2,24 +2,41 @@
 import argparse
 import requests
 import time
-import pygame
 import os
 import json
 import hashlib
+import functools
+import math
+import shutil
 import signal
 import sys
-from threading import Thread
+from threading import Thread, Event, RLock, BoundedSemaphore
+from contextlib import nullcontext
 from datetime import datetime
 from urllib.parse import urlparse
 import logging
 
+# Optional C JSON codec for the config file
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_SOUND = os.path.join(SCRIPT_DIR, "sound.mp3")
 CONFIG_FILE = os.path.join(SCRIPT_DIR, "config.json")
 LOG_FILE = os.path.join(SCRIPT_DIR, "file_watcher.log")
 
-# Global flag for graceful shutdown
-shutdown_flag = False
+# Set once to ask every watcher and animation loop to stop
+SHUTDOWN = Event()
+
+# Shared HTTP session so retries and concurrent watchers reuse keep-alive connections
+POOL_SIZE = 32
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
 
 # Animation components
 class Colors:
@@ -108,15 +125,18 @@ class Spinner:
     def __init__(self, style='dots', speed=0.1):
         self.frames = self.STYLES.get(style, self.STYLES['dots'])
         self.speed = speed
+        self._n = len(self.frames)
         self.current_frame = 0
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         
     def get_frame(self):
-        now = time.time()
+        """Return (frame, advanced), where advanced means the frame changed"""
+        now = time.monotonic()
         if now - self.last_update > self.speed:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
+            self.current_frame = (self.current_frame + 1) % self._n
             self.last_update = now
-        return self.frames[self.current_frame]
+            return self.frames[self.current_frame], True
+        return self.frames[self.current_frame], False
 
 class AnimatedDisplay:
     """Main animated display handler"""
@@ -125,7 +145,14 @@ class AnimatedDisplay:
         self.spinners = {}
         self.progress_bars = {}
         self.lines = {}
+        self.countdowns = {}  # key -> (deadline, text with a {remaining} placeholder)
         self.last_height = 0
+        self._prev = []  # Lines drawn by the last render
+        self._sorted_keys = []
+        self._keys_dirty = False
+        self._dirty = True  # Something changed since the last render
+        # Watcher threads add lines and countdowns while render() walks them
+        self._lock = RLock()
         
     def _supports_color(self):
         """Check if terminal supports colors"""
@@ -137,47 +164,95 @@ class AnimatedDisplay:
             return f"{color}{text}{Colors.RESET}"
         return text
     
+    def _write(self, text):
+        """Write a whole frame to the terminal in one go"""
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        # Flush anything print() left in the text layer, then encode the frame
+        # once and hand it straight to the binary buffer
+        sys.stdout.flush()
+        buffer.write(text.encode(sys.stdout.encoding or 'utf-8', 'replace'))
+        buffer.flush()
+    
     def _clear_lines(self, count):
         """Clear the last count lines"""
-        for _ in range(count):
-            sys.stdout.write('\033[F\033[K')  # Move up and clear line
+        self._write('\033[F\033[K' * count)  # Move up and clear line
     
     def create_spinner(self, key, style, speed=0.1):
         """Create a new spinner"""
         self.spinners[key] = Spinner(style, speed)
+        self._dirty = True
         
     def create_progress_bar(self, key, total=None, width=30):
         """Create a new progress bar"""
         self.progress_bars[key] = ProgressBar(total, width)
+        self._dirty = True
         
     def update_line(self, key, text):
         """Update a line of text"""
-        self.lines[key] = text
+        with self._lock:
+            if key not in self.lines:
+                self._keys_dirty = True
+            self.lines[key] = text
+            self.countdowns.pop(key, None)
+            self._dirty = True
+        
+    def start_countdown(self, key, deadline, text):
+        """Show a line that counts down to a time.monotonic() deadline"""
+        with self._lock:
+            self.update_line(key, text.replace('{remaining}', str(max(0, math.ceil(deadline - time.monotonic())))))
+            self.countdowns[key] = (deadline, text)
         
     def update_progress(self, key, current=None, add=None):
         """Update progress bar"""
         if key in self.progress_bars:
             self.progress_bars[key].update(current, add)
+            self._dirty = True
             
     def render(self):
         """Render all animations"""
-        if shutdown_flag:
+        if SHUTDOWN.is_set():
             return
             
-        # Clear previous output
-        if self.last_height > 0:
-            self._clear_lines(self.last_height)
+        # Refresh countdown lines from their deadlines
+        if self.countdowns:
+            with self._lock:
+                now = time.monotonic()
+                for key, (deadline, text) in self.countdowns.items():
+                    line = text.replace('{remaining}', str(max(0, math.ceil(deadline - now))))
+                    if line != self.lines[key]:
+                        self.lines[key] = line
+                        self._dirty = True
+        
+        # Advance the spinners; skip the frame if nothing has moved
+        frames = {}
+        for key, spinner in self.spinners.items():
+            frames[key], advanced = spinner.get_frame()
+            if advanced:
+                self._dirty = True
+        if not self._dirty:
+            return
+        # Cleared before building so updates made meanwhile trigger another frame
+        self._dirty = False
         
         output_lines = []
         
         # Render spinners and progress bars
-        for key in sorted(self.lines.keys()):
+        # Keys rarely change, so only re-sort when a new one has been added
+        if self._keys_dirty:
+            with self._lock:
+                self._sorted_keys = sorted(self.lines)
+                self._keys_dirty = False
+        
+        for key in self._sorted_keys:
             line = self.lines[key]
             
             # Add spinner if exists
-            if key in self.spinners:
-                spinner_frame = self.spinners[key].get_frame()
-                spinner_colored = self._color(spinner_frame, Colors.BRIGHT_YELLOW)
+            if key in frames:
+                spinner_colored = self._color(frames[key], Colors.BRIGHT_YELLOW)
                 line = f"{spinner_colored} {line}"
             
             # Add progress bar if exists
@@ -191,10 +266,22 @@ class AnimatedDisplay:
             
             output_lines.append(line)
         
-        # Print all lines
-        for line in output_lines:
-            print(line)
-        
+        # Go back to the top of the previous frame and rewrite only the lines
+        # that changed, stepping over the rest
+        out = []
+        if self.last_height > 0:
+            out.append(f'\033[{self.last_height}F')
+        for i, line in enumerate(output_lines):
+            if i < len(self._prev) and line == self._prev[i]:
+                out.append('\n')
+            else:
+                out.append(f'\033[2K{line}\n')
+        if len(self._prev) > len(output_lines):
+            out.append('\033[J')  # Erase lines left over from a taller frame
+        
+        self._write(''.join(out))
+        
+        self._prev = output_lines
         self.last_height = len(output_lines)
         
     def clear(self):
@@ -202,26 +289,36 @@ class AnimatedDisplay:
         if self.last_height > 0:
             self._clear_lines(self.last_height)
             self.last_height = 0
+        self._prev = []
+        self._dirty = True
         
     def success(self, message):
         """Show success message"""
         checkmark = self._color('✓', Colors.BRIGHT_GREEN)
         print(f"{checkmark} {message}")
+        self._prev = []  # Cursor moved; redraw the whole frame next time
+        self._dirty = True
         
     def error(self, message):
         """Show error message"""
         cross = self._color('✗', Colors.BRIGHT_RED)
         print(f"{cross} {message}")
+        self._prev = []  # Cursor moved; redraw the whole frame next time
+        self._dirty = True
         
     def warning(self, message):
         """Show warning message"""
         warning = self._color('⚠', Colors.BRIGHT_YELLOW)
         print(f"{warning} {message}")
+        self._prev = []  # Cursor moved; redraw the whole frame next time
+        self._dirty = True
         
     def info(self, message):
         """Show info message"""
         info = self._color('ℹ', Colors.BRIGHT_BLUE)
         print(f"{info} {message}")
+        self._prev = []  # Cursor moved; redraw the whole frame next time
+        self._dirty = True
 
 # Global animated display instance
 display = AnimatedDisplay()
@@ -241,17 +338,19 @@ def setup_logging(verbose=False):
 
 def signal_handler(signum, frame):
     """Handle Ctrl+C gracefully"""
-    global shutdown_flag
-    shutdown_flag = True
+    SHUTDOWN.set()
     display.clear()
     display.warning("Received interrupt signal. Shutting down gracefully...")
+    SESSION.close()
     sys.exit(0)
 
 def load_config():
     """Load configuration from JSON file"""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        with open(CONFIG_FILE, 'rb') as f:
+            data = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data) if HAS_ORJSON else json.loads(data)
     except FileNotFoundError:
         return {}
     except json.JSONDecodeError:
@@ -261,66 +360,95 @@ def load_config():
 def save_config(config):
     """Save configuration to JSON file"""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        if HAS_ORJSON:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode('utf-8')
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(data)
     except Exception as e:
         print(f"⚠️ Failed to save config: {e}")
 
 def get_file_hash(file_path):
-    """Calculate MD5 hash of a file"""
-    hash_md5 = hashlib.md5()
+    """Calculate MD5 hash of a file, reusing it while the file is unchanged"""
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        st = os.stat(file_path)
+        return _hash_file(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
     except Exception:
+        # Failures propagate out of _hash_file so lru_cache never memoizes them
         return None
 
+@functools.lru_cache(maxsize=256)
+def _hash_file(file_path, mtime_ns, size):
+    """Hash file contents; mtime and size are only part of the cache key"""
+    with open(file_path, "rb") as f:
+        # file_digest (Python 3.11+) runs the read/update loop in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "md5").hexdigest()
+        
+        hash_md5 = hashlib.md5()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hash_md5.update(chunk)
+        return hash_md5.hexdigest()
+
+class _Interrupted(Exception):
+    """Raised mid-download when shutdown is requested"""
+
+class _ProgressWriter:
+    """File wrapper that records download progress for the display"""
+    def __init__(self, f, url_key=None):
+        self.f = f
+        self.url_key = url_key
+        self.written = 0
+    
+    def write(self, data):
+        if SHUTDOWN.is_set():
+            raise _Interrupted()
+        self.f.write(data)
+        self.written += len(data)
+        # The animation loop redraws progress; just record it here
+        if self.url_key:
+            display.update_progress(self.url_key, self.written)
+
 def fetch_file(file_url, save_path, headers=None, check_size=False, expected_size=None, url_key=None):
+    name = os.path.basename(file_url)
     try:
         if url_key:
             display.create_spinner(url_key, style=spinner_style)
-            display.update_line(url_key, f"Checking {os.path.basename(file_url)}...")
-            display.render()
+            display.update_line(url_key, f"Checking {name}...")
 
         # HEAD request to check existence
-        head_response = requests.head(file_url, timeout=10, headers=headers or {})
+        head_response = SESSION.head(file_url, timeout=10, headers=headers or {})
         if head_response.status_code == 200:
             content_length = head_response.headers.get('content-length')
             if content_length:
                 file_size = int(content_length)
                 if url_key:
-                    display.update_line(url_key, f"Found {os.path.basename(file_url)} ({file_size/1024/1024:.2f} MB)")
-                    display.render()
+                    display.update_line(url_key, f"Found {name} ({file_size/1024/1024:.2f} MB)")
                 if check_size and expected_size and file_size != expected_size:
                     if url_key:
                         display.error(f"File size mismatch. Expected: {expected_size}, Got: {file_size}")
                     return False
                 if url_key:
                     display.create_progress_bar(url_key, file_size)
-                    display.update_line(url_key, f"Downloading {os.path.basename(file_url)}...")
+                    display.update_line(url_key, f"Downloading {name}...")
 
-        response = requests.get(file_url, stream=True, timeout=30, headers=headers or {})
-        if response.status_code == 200:
+        with SESSION.get(file_url, stream=True, timeout=30, headers=headers or {}) as response:
+            if response.status_code != 200:
+                if url_key:
+                    display.warning(f"HTTP {response.status_code} for {file_url}")
+                return False
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            downloaded = 0
+            # Copy the raw stream in 1 MiB blocks, still undoing any
+            # Content-Encoding the server applied
+            response.raw.decode_content = True
             with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if url_key:
-                            display.update_progress(url_key, downloaded)
-                            display.render()
-                            time.sleep(0.01)
-            if url_key:
-                display.success(f"Downloaded {os.path.basename(file_url)}")
-            return True
-        else:
-            if url_key:
-                display.warning(f"HTTP {response.status_code} for {file_url}")
-            return False
+                shutil.copyfileobj(response.raw, _ProgressWriter(f, url_key), length=1 << 20)
+        if url_key:
+            display.success(f"Downloaded {name}")
+        return True
+    except _Interrupted:
+        return False
     except Exception as e:
         if url_key:
             display.error(f"Error: {str(e)}")
@@ -328,6 +456,8 @@ def fetch_file(file_url, save_path, headers=None, check_size=False, expected_siz
 
 def play_sound(sound_path):
     try:
+        # pygame loads SDL on import, so only pay for it when a sound plays
+        import pygame
         pygame.mixer.init()
         pygame.mixer.music.load(sound_path)
         pygame.mixer.music.play()
@@ -341,7 +471,7 @@ def send_notification(message, webhook_url=None):
     if webhook_url:
         try:
             payload = {"text": message}
-            requests.post(webhook_url, json=payload, timeout=10)
+            SESSION.post(webhook_url, json=payload, timeout=10)
             display.info(f"Notification sent")
         except Exception as e:
             display.error(f"Failed to send notification: {e}")
@@ -362,10 +492,21 @@ def auto_name_file(url, save_path):
     
     return save_path
 
-def watch_multiple_urls(urls, base_output_dir, interval, **kwargs):
+def watch_multiple_urls(urls, base_output_dir, interval, max_workers=None, **kwargs):
     """Watch multiple URLs simultaneously with animated display"""
+    # Every URL gets its own daemon watcher, since each one retries until its
+    # file appears; max_workers only caps how many are fetching at once
+    if max_workers is None:
+        max_workers = min(POOL_SIZE, len(urls))
+    slots = BoundedSemaphore(max_workers)
     threads = []
     
+    # Grow the connection pool if more fetches than it holds may run at once
+    if max_workers > POOL_SIZE:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=max_workers, max_retries=0)
+        SESSION.mount("https://", adapter)
+        SESSION.mount("http://", adapter)
+    
     display.info(f"Starting to watch {len(urls)} URLs...")
     
     for i, url in enumerate(urls):
@@ -374,19 +515,19 @@ def watch_multiple_urls(urls, base_output_dir, interval, **kwargs):
         
         url_key = f"url_{i+1}"
         
-        thread = Thread(target=watch_single_url, args=(url, output_path, interval, url_key), kwargs=kwargs)
-        thread.daemon = True
-        threads.append(thread)
-        thread.start()
-        
         # Initialize display for this URL
         display.create_spinner(url_key, style=spinner_style)
         display.update_line(url_key, f"Initializing {os.path.basename(url)}...")
+        
+        thread = Thread(target=watch_single_url, args=(url, output_path, interval, url_key, slots), kwargs=kwargs)
+        thread.daemon = True
+        threads.append(thread)
+        thread.start()
     
     # Animation loop
-    while any(thread.is_alive() for thread in threads) and not shutdown_flag:
+    while any(thread.is_alive() for thread in threads) and not SHUTDOWN.is_set():
         display.render()
-        time.sleep(0.1)
+        SHUTDOWN.wait(0.1)
     
     # Wait for all threads to complete
     for thread in threads:
@@ -395,29 +536,33 @@ def watch_multiple_urls(urls, base_output_dir, interval, **kwargs):
     display.clear()
     display.success("All downloads completed!")
 
-def watch_single_url(url, output_path, interval, url_key=None, **kwargs):
+def watch_single_url(url, output_path, interval, url_key=None, slots=None, **kwargs):
     """Watch a single URL with animated display"""
-    global shutdown_flag
+    name = os.path.basename(url)
     
     attempt = 0
     max_attempts = kwargs.get('max_attempts', 0)  # 0 means unlimited
     
-    while not shutdown_flag:
+    while not SHUTDOWN.is_set():
         attempt += 1
         
         if max_attempts > 0 and attempt > max_attempts:
             if url_key:
-                display.error(f"Max attempts ({max_attempts}) reached for {os.path.basename(url)}")
+                display.error(f"Max attempts ({max_attempts}) reached for {name}")
             break
         
         if url_key:
-            display.update_line(url_key, f"Attempt {attempt} - {os.path.basename(url)}")
+            display.update_line(url_key, f"Attempt {attempt} - {name}")
+        
+        # Hold a fetch slot for the attempt only, never across the retry wait
+        with slots or nullcontext():
+            fetched = fetch_file(url, output_path, 
+                                 headers=kwargs.get('headers'),
+                                 check_size=kwargs.get('check_size', False),
+                                 expected_size=kwargs.get('expected_size'),
+                                 url_key=url_key)
         
-        if fetch_file(url, output_path, 
-                     headers=kwargs.get('headers'),
-                     check_size=kwargs.get('check_size', False),
-                     expected_size=kwargs.get('expected_size'),
-                     url_key=url_key):
+        if fetched:
             
             # Success! Play sound and send notifications
             if not kwargs.get('no_sound', False):
@@ -432,18 +577,23 @@ def watch_single_url(url, output_path, interval, url_key=None, **kwargs):
             
             break
         
-        if shutdown_flag:
-            break
-        
-        # Show countdown for next attempt
+        # Show countdown for next attempt; the animation loop keeps it ticking,
+        # and the wait returns as soon as shutdown is requested
         if url_key:
-            for remaining in range(interval, 0, -1):
-                if shutdown_flag:
-                    break
-                display.update_line(url_key, f"Waiting {remaining}s before retry - {os.path.basename(url)}")
-                time.sleep(1)
-        else:
-            time.sleep(interval)
+            display.start_countdown(url_key, time.monotonic() + interval,
+                                    "Waiting {remaining}s before retry - " + name)
+        if SHUTDOWN.wait(timeout=interval):
+            break
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 def main():
     global spinner_style  # Declare as global so we can modify it
@@ -481,6 +631,7 @@ Examples:
     parser.add_argument("--check-size", action="store_true", help="Verify file size matches expected size")
     parser.add_argument("--headers", help="JSON string of HTTP headers to send")
     parser.add_argument("--webhook", help="Webhook URL for notifications (Slack, Discord, etc.)")
+    parser.add_argument("--max-workers", type=positive_int, help="Maximum URLs fetched at once with -m; the rest wait their turn (default: number of URLs, up to 32)")
     
     # Utility options
     parser.add_argument("--spinner", choices=list(Spinner.STYLES.keys()), help="Spinner style (default: dots)")
@@ -522,6 +673,8 @@ Examples:
         try:
             with open(args.multiple, 'r') as f:
                 urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            # Watch each URL once, keeping the file's order
+            urls = list(dict.fromkeys(urls))
             
             if not urls:
                 display.error("No URLs found in file")
@@ -531,6 +684,7 @@ Examples:
             os.makedirs(args.out, exist_ok=True)
             
             watch_multiple_urls(urls, args.out, args.interval,
+                              max_workers=args.max_workers,
                               no_sound=args.no_sound,
                               sound=args.sound,
                               max_attempts=args.max_attempts,
@@ -572,9 +726,9 @@ Examples:
         thread.start()
         
         # Animation loop
-        while thread.is_alive() and not shutdown_flag:
+        while thread.is_alive() and not SHUTDOWN.is_set():
             display.render()
-            time.sleep(0.1)
+            SHUTDOWN.wait(0.1)
         
         thread.join()
         display.clear()
@@ -595,6 +749,8 @@ Examples:
         }
         save_config(config_data)
         display.success(f"Configuration saved to {CONFIG_FILE}")
+    
+    SESSION.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
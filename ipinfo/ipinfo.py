@@ -1,7 +1,13 @@
 import argparse
+import socket
 import requests
-import psutil
 import ipaddress
+import time
+
+
+# Keep-alive session and (ip, fetched_at) cache for public IP lookups
+SESSION = requests.Session()
+_public_ip_cache = None
 
 
 def local_ips():
@@ -12,10 +18,11 @@ def local_ips():
     results = []
 
     try:
+        import psutil  # Only needed for local addresses, not --public
         addrs = psutil.net_if_addrs()
         for nic, info in addrs.items():
             for addr in info:
-                if addr.family.name == "AF_INET":  # IPv4 only
+                if addr.family == socket.AF_INET:  # IPv4 only
                     ip = addr.address
                     results.append((nic, ip))
     except Exception as e:
@@ -29,14 +36,23 @@ def print_local_ips(ips: list | tuple):
         print(f"  {ip} ({nic})")
 
 
-def public_ip():
+def public_ip(ttl=60):
     """
-    Gets the public IP address using an external service
+    Gets the public IP address using an external service.
+    The answer is reused for ttl seconds.
     """
+    global _public_ip_cache
+
+    now = time.monotonic()
+    if _public_ip_cache and now - _public_ip_cache[1] < ttl:
+        return _public_ip_cache[0]
+
     try:
-        response = requests.get("https://ipinfo.io/ip", timeout=5)
+        response = SESSION.get("https://ipinfo.io/ip", timeout=5)
         response.raise_for_status()  # Raise an HTTPError for bad responses
-        return response.text.strip()
+        ip = response.text.strip()
+        _public_ip_cache = (ip, now)
+        return ip
     except requests.exceptions.RequestException as e:
         print(f"Error getting public IP: {e}")
         return None
@@ -1,28 +1,52 @@
 import os
+import sys
 import argparse
+from operator import attrgetter
 
 # Directories to ignore
-DEFAULT_IGNORED_DIRS = {
+DEFAULT_IGNORED_DIRS = frozenset({
     '.git', '__pycache__', 'node_modules', '.venv',
     '.idea', '.vscode', 'dist', 'build', '.DS_Store'
-}
+})
+
+def sorted_entries(path, ignored_dirs):
+    """Return the non-ignored entries of a directory, sorted by name"""
+    # DirEntry caches the file type from the directory listing, so is_dir()
+    # usually needs no extra stat call
+    with os.scandir(path) as it:
+        return sorted((e for e in it if e.name not in ignored_dirs), key=attrgetter("name"))
 
 def print_tree(base_path, prefix="", ignored_dirs=None):
     if ignored_dirs is None:
         ignored_dirs = DEFAULT_IGNORED_DIRS
 
-    entries = sorted(os.listdir(base_path))
-    entries = [e for e in entries if e not in ignored_dirs]
+    # Walk depth-first with an explicit stack of (entries, next index, prefix)
+    # instead of recursing, and write lines out in batches
+    lines = []
+    entries = sorted_entries(base_path, ignored_dirs)
+    stack = [(entries, 0, prefix)]
+
+    while stack:
+        entries, index, prefix = stack.pop()
+        if index >= len(entries):
+            continue
+        stack.append((entries, index + 1, prefix))
+
+        entry = entries[index]
+        is_last = index == len(entries) - 1
+        connector = "└── " if is_last else "├── "
 
-    for index, entry in enumerate(entries):
-        full_path = os.path.join(base_path, entry)
-        connector = "└── " if index == len(entries) - 1 else "├── "
+        lines.append(prefix + connector + entry.name)
+        if len(lines) >= 1000:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
 
-        print(prefix + connector + entry)
+        if entry.is_dir(follow_symlinks=False):
+            extension = "    " if is_last else "│   "
+            stack.append((sorted_entries(entry.path, ignored_dirs), 0, prefix + extension))
 
-        if os.path.isdir(full_path):
-            extension = "    " if index == len(entries) - 1 else "│   "
-            print_tree(full_path, prefix + extension, ignored_dirs)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     parser = argparse.ArgumentParser(description="Print folder structure as a tree.")